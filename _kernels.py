@@ -0,0 +1,99 @@
+# --------------------------------------------------------------------------------
+# Kernels numéricos da análise, separados para compilação antecipada (AOT).
+#
+# Rodar `python _kernels.py` gera o módulo binário 'analise_kernels' (.so),
+# que o analise.py importa com prioridade: assim a primeira chamada não paga
+# os ~500ms de compilação JIT do LLVM, maiores que o pipeline inteiro para
+# uma planilha deste tamanho. Sem o binário, o analise.py aplica @njit
+# nestas mesmas funções como fallback.
+# --------------------------------------------------------------------------------
+
+import numpy as np
+from numba.pycc import CC
+
+cc = CC('analise_kernels')
+
+@cc.export('kernel_coluna', 'UniTuple(f8[:], 4)(f8[:], f8)')
+def kernel_coluna(x, tempo):
+    """
+    Percorre a coluna uma única vez calculando velocidade, aceleração e as
+    médias móveis de 3 e 7 anos (somas correntes, custo O(1) por elemento).
+    A fusão evita as 3 varreduras separadas (diff, diff, rolling) por coluna.
+    """
+    n = x.shape[0]
+    vel = np.empty(n)
+    acel = np.empty(n)
+    mm3 = np.empty(n)
+    mm7 = np.empty(n)
+    soma3 = 0.0
+    soma7 = 0.0
+    for i in range(n):
+        if i == 0:
+            vel[i] = np.nan
+            acel[i] = np.nan
+        else:
+            vel[i] = (x[i] - x[i - 1]) / tempo
+            acel[i] = (vel[i] - vel[i - 1]) / tempo
+        soma3 += x[i]
+        if i >= 3:
+            soma3 -= x[i - 3]
+        mm3[i] = soma3 / 3.0 if i >= 2 else np.nan
+        soma7 += x[i]
+        if i >= 7:
+            soma7 -= x[i - 7]
+        mm7[i] = soma7 / 7.0 if i >= 6 else np.nan
+    return vel, acel, mm3, mm7
+
+@cc.export('kernel_matriz', 'UniTuple(f8[:, :], 4)(f8[:, :], f8[:])')
+def kernel_matriz(m, tempos):
+    """
+    Versão em lote do kernel_coluna: recebe as colunas empilhadas em uma
+    matriz (n, k) e o intervalo de tempo de cada coluna, devolvendo as
+    quatro matrizes de saída em uma única chamada a partir do main.
+    """
+    n = m.shape[0]
+    k = m.shape[1]
+    vel = np.empty((n, k))
+    acel = np.empty((n, k))
+    mm3 = np.empty((n, k))
+    mm7 = np.empty((n, k))
+    for j in range(k):
+        tempo = tempos[j]
+        soma3 = 0.0
+        soma7 = 0.0
+        for i in range(n):
+            if i == 0:
+                vel[i, j] = np.nan
+                acel[i, j] = np.nan
+            else:
+                vel[i, j] = (m[i, j] - m[i - 1, j]) / tempo
+                acel[i, j] = (vel[i, j] - vel[i - 1, j]) / tempo
+            soma3 += m[i, j]
+            if i >= 3:
+                soma3 -= m[i - 3, j]
+            mm3[i, j] = soma3 / 3.0 if i >= 2 else np.nan
+            soma7 += m[i, j]
+            if i >= 7:
+                soma7 -= m[i - 7, j]
+            mm7[i, j] = soma7 / 7.0 if i >= 6 else np.nan
+    return vel, acel, mm3, mm7
+
+@cc.export('rolling_mean', 'f8[:](f8[:], i8)')
+def rolling_mean(x, janela):
+    """
+    Média móvel por soma corrente (uma adição e uma subtração por elemento),
+    sem o custo de montagem do agregador de Series.rolling a cada chamada.
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    soma = 0.0
+    for i in range(janela):
+        soma += x[i]
+    out[janela - 1] = soma / janela
+    for i in range(janela, n):
+        soma += x[i] - x[i - janela]
+        out[i] = soma / janela
+    return out
+
+if __name__ == '__main__':
+    cc.compile()
@@ -1,8 +1,15 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from docx import Document
+from numba import njit
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from docxtpl import DocxTemplate, InlineImage
 from docx.shared import Inches
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import gc
 import os
 
 # --------------------------------------------------------------------------------
@@ -28,32 +35,84 @@ import os
 # também demanda cautela na interpretação dos resultados.
 # --------------------------------------------------------------------------------
 
+COLUNAS_PLANILHA = ['Ano', 'População Estimada', 'PIB Estimado (R$ em Bilhões)', 'Renda per capita']
+
 def carregar_dados(nome_arquivo):
     """
     Lê a planilha Excel e realiza o tratamento inicial:
       - Ordena pelos anos;
       - Converte a coluna 'Ano' para inteiro;
       - Cria a coluna 'Renda per capita (Interpolada)' preenchendo os valores faltantes por interpolação linear.
+
+    Para acelerar execuções repetidas, o resultado é mantido em um cache Parquet
+    ao lado da planilha: se o cache existir e for mais recente que o Excel,
+    ele é carregado diretamente, evitando todo o parsing do XLSX.
+
+    Também aceita arquivos já convertidos para formatos colunares
+    (.parquet ou .feather), lidos diretamente sem passar pelo Excel.
     """
+    if nome_arquivo.endswith('.parquet'):
+        df = pd.read_parquet(nome_arquivo)
+    elif nome_arquivo.endswith('.feather'):
+        df = pd.read_feather(nome_arquivo)
+    else:
+        cache = nome_arquivo + '.parquet'
+        if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(nome_arquivo):
+            return pd.read_parquet(cache)
 
-    df = pd.read_excel("Planilha do Desafio 2 -Trilhas 2B.xlsx", header=1)  # Se o cabeçalho estiver na segunda linha (índice 1)
+        df = pd.read_excel(nome_arquivo, header=1, engine='calamine',
+                           usecols=COLUNAS_PLANILHA)  # Se o cabeçalho estiver na segunda linha (índice 1)
 
-    # Converter 'Ano' para inteiro e ordenar
+    # Converter 'Ano' para inteiro e ordenar. A planilha normalmente já vem
+    # ordenada; a verificação de monotonicidade é O(n) em C e evita a
+    # permutação completa do frame quando não há nada a reordenar
     df['Ano'] = df['Ano'].astype(int)
-    df.sort_values('Ano', inplace=True)
-    
-    # Interpolação linear na coluna 'Renda per capita'
-    df['Renda per capita (Interpolada)'] = df['Renda per capita'].interpolate(method='linear')
-    
+    if not df['Ano'].is_monotonic_increasing:
+        df = df.sort_values('Ano', kind='stable', ignore_index=True)
+
+    # Interpolação linear na coluna 'Renda per capita' usando os anos como eixo x
+    # (np.interp é um laço em C, sem o despacho genérico de Series.interpolate)
+    y = df['Renda per capita'].to_numpy(dtype=np.float64)
+    x = df['Ano'].to_numpy(dtype=np.float64)
+    validos = ~np.isnan(y)
+    df['Renda per capita (Interpolada)'] = np.interp(x, x[validos], y[validos])
+
+    # Grava o cache para que as próximas execuções pulem o parsing do Excel
+    if not nome_arquivo.endswith(('.parquet', '.feather')):
+        df.to_parquet(cache, engine='pyarrow', compression='zstd')
+
     return df
 
+# Kernels numéricos: preferir o módulo pré-compilado (gerado por
+# `python _kernels.py`), que elimina o custo de JIT na primeira chamada;
+# sem ele, compilar as mesmas funções com @njit em tempo de execução.
+try:
+    from analise_kernels import (kernel_coluna as _kernel_coluna,
+                                 kernel_matriz as _kernel_matriz,
+                                 rolling_mean)
+except ImportError:
+    from _kernels import kernel_coluna, kernel_matriz, rolling_mean
+    _kernel_coluna = njit(cache=True, fastmath=True)(kernel_coluna)
+    _kernel_matriz = njit(cache=True, fastmath=True)(kernel_matriz)
+    rolling_mean = njit(cache=True, fastmath=True)(rolling_mean)
+
 def calcular_derivadas(df, coluna, tempo=1):
     """
     Calcula a velocidade (1ª derivada) e a aceleração (2ª derivada) da coluna informada.
     O parâmetro 'tempo' representa o intervalo em anos entre as medições (ex.: 2 para dados bienais).
     """
-    velocidade = df[coluna].diff() / tempo
-    aceleracao = velocidade.diff() / tempo
+    arr = df[coluna].to_numpy(dtype=np.float64, copy=False)
+
+    velocidade = np.empty_like(arr)
+    velocidade[0] = np.nan
+    np.subtract(arr[1:], arr[:-1], out=velocidade[1:])
+    velocidade /= tempo
+
+    aceleracao = np.empty_like(arr)
+    aceleracao[0] = np.nan
+    np.subtract(velocidade[1:], velocidade[:-1], out=aceleracao[1:])
+    aceleracao /= tempo
+
     return velocidade, aceleracao
 
 def calcular_medias_moveis(df, coluna, janelas=[3, 7]):
@@ -61,9 +120,10 @@ def calcular_medias_moveis(df, coluna, janelas=[3, 7]):
     Calcula médias móveis para as janelas especificadas (ex.: 3 e 7 anos).
     Retorna um dicionário com as médias móveis.
     """
+    arr = df[coluna].to_numpy(dtype=np.float64)
     medias = {}
     for janela in janelas:
-        medias[f'MM_{janela}'] = df[coluna].rolling(window=janela).mean()
+        medias[f'MM_{janela}'] = rolling_mean(arr, janela)
     return medias
 
 def calcular_dispersao(df, coluna):
@@ -78,239 +138,201 @@ def calcular_dispersao(df, coluna):
 def gerar_planilha_analise(df, nome_arquivo):
     """
     Gera uma planilha Excel com todos os dados originais e os dados processados (derivadas, médias móveis, etc.).
+
+    O arquivo Excel é o entregável do desafio, então o formato se mantém;
+    o engine xlsxwriter serializa as células bem mais rápido que o openpyxl.
+    (Sem constant_memory: o pandas escreve coluna a coluna e esse modo
+    exige escrita estritamente em ordem de linha.)
     """
-    with pd.ExcelWriter(nome_arquivo, engine='openpyxl') as writer:
+    with pd.ExcelWriter(nome_arquivo, engine='xlsxwriter') as writer:
         df.to_excel(writer, index=False, sheet_name='Analise')
     
     print(f'[OK] Planilha de análise "{nome_arquivo}" gerada com sucesso.')
 
-def gerar_relatorio(df, graficos, nome_arquivo_doc):
+def _formatar_texto(tabela):
     """
-    Gera um relatório DOCX que inclui:
-      - Introdução com os dados originais e o contexto do estudo;
-      - Descrição detalhada do processo de cálculos (interpolação, derivadas e médias móveis);
-      - Uma tabela resumo com as estatísticas dos indicadores;
-      - Apresentação dos gráficos gerados (com explicações sobre o que cada gráfico representa);
-      - Uma seção exclusiva para analisar os impactos do período da COVID;
-      - Conclusões e observações finais.
+    Converte cada coluna do DataFrame para texto de uma única vez (floats com
+    2 casas decimais), evitando uma conversão str() por célula nos laços de
+    preenchimento das tabelas do relatório.
     """
-    doc = Document()
-    
-    # Título
-    doc.add_heading('Relatório de Análise de Dados do Estado do Maranhão', 0)
-    
-    # Introdução
-    doc.add_heading('1. Introdução', level=1)
-    doc.add_paragraph(
-        "Este relatório apresenta uma análise dos dados referentes à População Estimada, PIB Estimado (R$ em Bilhões) e Renda per capita, "
-        "no período de 2010 a 2024. A análise contempla tanto os dados originais quanto os valores processados por meio de fórmulas, "
-        "como interpolação, cálculo de derivadas e médias móveis. Especial atenção foi dada ao impacto da COVID (aproximadamente 2020-2021), "
-        "que provocou variações significativas nos indicadores."
-    )
-    
-    # Dados Originais
-    doc.add_heading('2. Dados Originais', level=1)
-    doc.add_paragraph("A seguir, apresenta-se uma amostra dos dados originais conforme extraídos da planilha:")
-    
-    # Criar tabela com os dados originais (limitada às 10 primeiras linhas para visualização)
+    texto = {}
+    for col in tabela.columns:
+        serie = tabela[col]
+        if serie.dtype.kind == 'f':
+            texto[col] = serie.map(lambda v: f'{v:.2f}')
+        else:
+            texto[col] = serie.astype(str)
+    return pd.DataFrame(texto, index=tabela.index)
+
+def _gerar_grafico(caminho, anos, series, titulo, rotulo_y):
+    """
+    Desenha um gráfico de linhas e o salva em 'caminho'. Recebe apenas
+    ndarrays e strings (nada de DataFrame) para que a chamada possa ser
+    serializada e executada em outro processo.
+    """
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    for rotulo, valores in series:
+        ax.plot(anos, valores, marker='o', label=rotulo)
+    ax.set_title(titulo)
+    ax.set_xlabel('Ano')
+    ax.set_ylabel(rotulo_y)
+    ax.legend()
+    ax.grid(True)
+    # dpi 80 é indistinguível na largura de 5.5" do relatório, e o nível 1
+    # de compressão zlib evita o custo do nível máximo por alguns KB a mais
+    fig.savefig(caminho, dpi=80, format='png', pil_kwargs={'compress_level': 1})
+
+def gerar_relatorio(df, df_processado, graficos, nome_arquivo_doc):
+    """
+    Gera o relatório DOCX a partir do template 'relatorio_template.docx'
+    (produzido por gerar_template_relatorio.py). Todo o texto fixo já vive
+    no template; uma única chamada de render preenche as tabelas de dados,
+    as estatísticas e os gráficos, em vez de montar o documento nó a nó
+    com chamadas add_* do python-docx.
+
+    'df' traz as colunas originais/interpolada completas (dados originais e
+    estatísticas); 'df_processado' é só a amostra com as colunas derivadas
+    exibida na seção 7, o que permite ao chamador descartar o frame
+    completo antes desta fase.
+    """
+    tpl = DocxTemplate('relatorio_template.docx')
+
+    # Amostra dos dados originais (primeiras 10 linhas)
     df_orig = df[['Ano', 'População Estimada', 'PIB Estimado (R$ em Bilhões)', 'Renda per capita']].head(10)
-    tabela_origem = doc.add_table(rows=1, cols=len(df_orig.columns))
-    hdr_cells = tabela_origem.rows[0].cells
-    for i, col in enumerate(df_orig.columns):
-        hdr_cells[i].text = str(col)
-    for _, row in df_orig.iterrows():
-        row_cells = tabela_origem.add_row().cells
-        for i, item in enumerate(row):
-            row_cells[i].text = str(item)
-    
-    # Processos de Cálculo
-    doc.add_heading('3. Processo de Cálculo e Tratamento dos Dados', level=1)
-    doc.add_paragraph(
-        "Para obter uma análise mais robusta, foram aplicados os seguintes processos:\n"
-        "- **Interpolação Linear**: Preenche os valores faltantes na coluna 'Renda per capita', gerando a coluna "
-        "'Renda per capita (Interpolada)'.\n"
-        "- **Derivadas (Velocidade e Aceleração)**: Calculadas para cada indicador para evidenciar a taxa de variação "
-        "anual e a mudança dessa taxa. Nota: Para 'População Estimada', foi considerado um intervalo de 2 anos.\n"
-        "- **Médias Móveis**: Foram calculadas para janelas de 3 e 7 anos, suavizando oscilações e destacando as tendências de longo prazo.\n"
-        "- **Medidas de Dispersão**: Média, variância e desvio padrão foram computados para quantificar a dispersão dos dados."
-    )
-    
-    # Tabela de Estatísticas Descritivas
-    doc.add_heading('4. Estatísticas Descritivas', level=1)
-    doc.add_paragraph("A tabela abaixo resume as principais medidas de dispersão dos indicadores:")
-    tabela_estat = doc.add_table(rows=1, cols=5)
-    hdr_cells = tabela_estat.rows[0].cells
-    hdr_cells[0].text = 'Métrica'
-    hdr_cells[1].text = 'População'
-    hdr_cells[2].text = 'PIB'
-    hdr_cells[3].text = 'Renda p/ capita'
-    hdr_cells[4].text = 'Renda (Interp.)'
-    
-    media_pop, var_pop, std_pop = calcular_dispersao(df, 'População Estimada')
-    media_pib, var_pib, std_pib = calcular_dispersao(df, 'PIB Estimado (R$ em Bilhões)')
-    media_renda, var_renda, std_renda = calcular_dispersao(df, 'Renda per capita')
-    media_renda_i, var_renda_i, std_renda_i = calcular_dispersao(df, 'Renda per capita (Interpolada)')
-    
+
+    # Uma única chamada de agg computa as três medidas para as quatro colunas,
+    # em vez de 12 passadas separadas via calcular_dispersao
+    colunas_estat = ['População Estimada', 'PIB Estimado (R$ em Bilhões)',
+                     'Renda per capita', 'Renda per capita (Interpolada)']
+    stats = df[colunas_estat].agg(['mean', 'var', 'std'])
+
     estatisticas = [
-        ['Média', f'{media_pop:.2f}', f'{media_pib:.2f}', f'{media_renda:.2f}', f'{media_renda_i:.2f}'],
-        ['Variância', f'{var_pop:.2f}', f'{var_pib:.2f}', f'{var_renda:.2f}', f'{var_renda_i:.2f}'],
-        ['Desvio Padrão', f'{std_pop:.2f}', f'{std_pib:.2f}', f'{std_renda:.2f}', f'{std_renda_i:.2f}']
+        ['Média'] + [f'{stats.loc["mean", c]:.2f}' for c in colunas_estat],
+        ['Variância'] + [f'{stats.loc["var", c]:.2f}' for c in colunas_estat],
+        ['Desvio Padrão'] + [f'{stats.loc["std", c]:.2f}' for c in colunas_estat]
     ]
-    for linha in estatisticas:
-        row_cells = tabela_estat.add_row().cells
-        for i, valor in enumerate(linha):
-            row_cells[i].text = str(valor)
-    
-    # Gráficos e Análises Visuais
-    doc.add_heading('5. Gráficos e Análises Visuais', level=1)
-    doc.add_paragraph(
-        "Os gráficos a seguir apresentam de forma visual a evolução dos indicadores, as derivadas (velocidade e aceleração) e as médias móveis. "
-        "Cada gráfico foi elaborado para facilitar a interpretação das tendências e das oscilações dos dados."
-    )
-    
-    for descricao, caminho in graficos.items():
-        doc.add_heading(descricao, level=2)
-        doc.add_picture(caminho, width=Inches(5.5))
-        if descricao == 'Evolução dos Indicadores':
-            doc.add_paragraph(
-                "Este gráfico ilustra a evolução da População Estimada, do PIB Estimado e da Renda per capita (após interpolação) entre 2010 e 2024. "
-                "Observa-se a tendência geral de crescimento, mas também possíveis quedas ou estagnações, especialmente em períodos de instabilidade econômica."
-            )
-        elif descricao == 'Dinâmica do PIB':
-            doc.add_paragraph(
-                "Neste gráfico, são analisados a velocidade (taxa de variação anual) e a aceleração do PIB. "
-                "Notamos que, durante o período de COVID, houve uma desaceleração brusca, seguida por uma recuperação gradual."
-            )
-        elif descricao == 'Médias Móveis da Renda per capita':
-            doc.add_paragraph(
-                "Aqui são exibidas a Renda per capita original (após interpolação) e suas médias móveis de 3 e 7 anos. "
-                "Essas médias ajudam a suavizar oscilações e a evidenciar tendências de longo prazo, mesmo diante de variações pontuais."
-            )
-    
-    # Análise do Período da COVID
-    doc.add_heading('6. Impacto do Período da COVID', level=1)
-    doc.add_paragraph(
-        "O período da COVID (aproximadamente 2020-2021) mostrou impactos significativos nos indicadores analisados. "
-        "Observa-se que:\n"
-        "- O PIB apresentou uma queda acentuada durante os anos de 2020 e 2021, refletindo a desaceleração econômica global.\n"
-        "- A Renda per capita sofreu variações marcantes, possivelmente devido à perda de empregos e à redução do poder de compra.\n"
-        "- A população, coletada em alguns anos de forma bienal, mostra variações que devem ser interpretadas com cautela, "
-        "pois a frequência da coleta pode mascarar mudanças abruptas ocorridas durante a pandemia.\n\n"
-        "Esses efeitos evidenciam a importância de se aplicar técnicas de suavização, como as médias móveis, e de se analisar as derivadas "
-        "(velocidade e aceleração) para compreender melhor a dinâmica dos dados durante períodos de crise."
-    )
-    
-    # Dados Gerados pelas Fórmulas (amostra)
-    doc.add_heading('7. Dados Processados e Resultados das Fórmulas', level=1)
-    doc.add_paragraph(
-        "A tabela a seguir apresenta uma amostra dos dados processados, incluindo os cálculos de derivadas e médias móveis. "
-        "Estes dados foram gerados automaticamente a partir dos dados originais e permitem uma análise quantitativa detalhada."
-    )
-    
-    # Exibindo uma amostra dos dados processados (primeiras 10 linhas)
-    df_processado = df.head(10)
-    cols = df_processado.columns.tolist()
-    tabela_processada = doc.add_table(rows=1, cols=len(cols))
-    hdr_cells = tabela_processada.rows[0].cells
-    for i, col in enumerate(cols):
-        hdr_cells[i].text = str(col)
-    for _, row in df_processado.iterrows():
-        row_cells = tabela_processada.add_row().cells
-        for i, item in enumerate(row):
-            row_cells[i].text = str(item)
-    
-    # Conclusões Finais
-    doc.add_heading('8. Conclusões e Observações Finais', level=1)
-    doc.add_paragraph(
-        "Em síntese, a análise dos dados revela que:\n"
-        "- Os processos de interpolação, cálculo de derivadas e médias móveis foram fundamentais para suavizar as oscilações e "
-        "destacar as tendências dos indicadores ao longo dos anos.\n"
-        "- O período da COVID impactou negativamente o PIB e a Renda per capita, embora haja sinais de recuperação pós-pandemia.\n"
-        "- A coleta de dados populacionais de forma bienal impõe desafios na interpretação de variações abruptas, sendo necessário "
-        "cautela ao analisar esses números.\n\n"
-        "Essas análises permitem um entendimento mais profundo das dinâmicas socioeconômicas do Estado do Maranhão, "
-        "oferecendo subsídios para decisões e políticas públicas fundamentadas."
-    )
-    
-    doc.save(nome_arquivo_doc)
+
+    descricoes = {
+        'Evolução dos Indicadores':
+            "Este gráfico ilustra a evolução da População Estimada, do PIB Estimado e da Renda per capita (após interpolação) entre 2010 e 2024. "
+            "Observa-se a tendência geral de crescimento, mas também possíveis quedas ou estagnações, especialmente em períodos de instabilidade econômica.",
+        'Dinâmica do PIB':
+            "Neste gráfico, são analisados a velocidade (taxa de variação anual) e a aceleração do PIB. "
+            "Notamos que, durante o período de COVID, houve uma desaceleração brusca, seguida por uma recuperação gradual.",
+        'Médias Móveis da Renda per capita':
+            "Aqui são exibidas a Renda per capita original (após interpolação) e suas médias móveis de 3 e 7 anos. "
+            "Essas médias ajudam a suavizar oscilações e a evidenciar tendências de longo prazo, mesmo diante de variações pontuais.",
+    }
+
+    contexto = {
+        'dados_orig': _formatar_texto(df_orig).to_numpy().tolist(),
+        'estatisticas': estatisticas,
+        'colunas_proc': df_processado.columns.tolist(),
+        'dados_proc': _formatar_texto(df_processado).to_numpy().tolist(),
+        'graficos': [{'titulo': descricao,
+                      'imagem': InlineImage(tpl, caminho, width=Inches(5.5)),
+                      'descricao': descricoes.get(descricao, '')}
+                     for descricao, caminho in graficos.items()],
+    }
+
+    tpl.render(contexto)
+    tpl.save(nome_arquivo_doc)
     print(f'[OK] Relatório "{nome_arquivo_doc}" gerado com sucesso.')
 
+@lru_cache(maxsize=1)
+def montar_dados(nome_arquivo, mtime):
+    """
+    Monta o DataFrame completo da análise: carga da planilha, redução dos
+    tipos numéricos e colunas derivadas (velocidade, aceleração e médias
+    móveis). O mtime do arquivo participa da chave do lru_cache, então
+    chamadas repetidas no mesmo processo (ex.: um wrapper CLI ou web) com a
+    planilha inalterada devolvem o resultado memoizado sem refazer nada.
+    """
+    df = carregar_dados(nome_arquivo)
+
+    # Reduzir os tipos numéricos pela metade (float32/int32): os indicadores
+    # precisam de ~7 dígitos significativos, então não há perda relevante
+    colunas_float = df.select_dtypes('float64').columns
+    df[colunas_float] = df[colunas_float].astype('float32')
+    df['Ano'] = df['Ano'].astype('int32')
+
+    # Calcular derivadas (velocidade e aceleração) e médias móveis (janelas
+    # de 3 e 7 anos) em uma única passada por coluna.
+    # Para 'População Estimada', como os dados podem ser coletados de 2 em 2 anos, usa-se tempo=2.
+    colunas_indicadores = ['População Estimada', 'PIB Estimado (R$ em Bilhões)', 'Renda per capita (Interpolada)']
+    matriz = df[colunas_indicadores].to_numpy(dtype=np.float64)
+    tempos = np.array([2.0, 1.0, 1.0])  # População Estimada pode ser bienal
+    vel, acel, mm3, mm7 = _kernel_matriz(matriz, tempos)
+
+    novas_colunas = {}
+    for j, coluna in enumerate(colunas_indicadores):
+        novas_colunas[f'{coluna} Velocidade'] = vel[:, j]
+        novas_colunas[f'{coluna} Aceleração'] = acel[:, j]
+        novas_colunas[f'{coluna} MM_3'] = mm3[:, j]
+        novas_colunas[f'{coluna} MM_7'] = mm7[:, j]
+
+    # Anexar todas as colunas de uma vez evita uma cópia do frame por atribuição
+    return pd.concat([df, pd.DataFrame(novas_colunas, index=df.index)], axis=1)
+
 def main():
     # Definição dos arquivos
     arquivo_excel = 'Planilha do Desafio 2 -Trilhas 2B.xlsx'
     arquivo_excel_saida = 'Analise_Desafio_2.xlsx'
     arquivo_doc = 'Relatorio_Analise_Desafio_2.docx'
-    
-    # 1) Carregar os dados da planilha
-    df = carregar_dados(arquivo_excel)
-    
-    # 2) Calcular derivadas (velocidade e aceleração)
-    # Para 'População Estimada', como os dados podem ser coletados de 2 em 2 anos, usa-se tempo=2.
-    for coluna in ['População Estimada', 'PIB Estimado (R$ em Bilhões)', 'Renda per capita (Interpolada)']:
-        tempo = 2 if coluna == 'População Estimada' else 1
-        vel, acel = calcular_derivadas(df, coluna, tempo=tempo)
-        df[f'{coluna} Velocidade'] = vel
-        df[f'{coluna} Aceleração'] = acel
-    
-    # 3) Calcular médias móveis (janelas de 3 e 7 anos)
-    for coluna in ['População Estimada', 'PIB Estimado (R$ em Bilhões)', 'Renda per capita (Interpolada)']:
-        medias = calcular_medias_moveis(df, coluna, janelas=[3, 7])
-        for key, valores in medias.items():
-            df[f'{coluna} {key}'] = valores
-    
+
+    # 1), 2) e 3) Carregar os dados da planilha e calcular as colunas
+    # derivadas (memoizado por caminho + mtime)
+    df = montar_dados(arquivo_excel, os.path.getmtime(arquivo_excel))
+
     # 4) Gerar a planilha de análise com todos os dados
     gerar_planilha_analise(df, arquivo_excel_saida)
     
     # 5) Gerar e salvar os gráficos
+    # Os três renders são independentes e rodam em processos paralelos;
+    # cada tarefa recebe apenas ndarrays para manter o pickling barato.
+    anos = df['Ano'].to_numpy()
+    tarefas = [
+        ('Evolução dos Indicadores', 'grafico_evolucao.png',
+         [('População', df['População Estimada'].to_numpy()),
+          ('PIB', df['PIB Estimado (R$ em Bilhões)'].to_numpy()),
+          ('Renda per capita', df['Renda per capita (Interpolada)'].to_numpy())],
+         'Evolução dos Indicadores (2010-2024)', 'Valores'),
+        ('Dinâmica do PIB', 'grafico_dinamica_pib.png',
+         [('Velocidade PIB', df['PIB Estimado (R$ em Bilhões) Velocidade'].to_numpy()),
+          ('Aceleração PIB', df['PIB Estimado (R$ em Bilhões) Aceleração'].to_numpy())],
+         'Dinâmica do PIB (Velocidade e Aceleração)', 'Variação'),
+        ('Médias Móveis da Renda per capita', 'grafico_media_movel.png',
+         [('Renda per capita', df['Renda per capita (Interpolada)'].to_numpy()),
+          ('Média Móvel 3 anos', df['Renda per capita (Interpolada) MM_3'].to_numpy()),
+          ('Média Móvel 7 anos', df['Renda per capita (Interpolada) MM_7'].to_numpy())],
+         'Médias Móveis da Renda per capita', 'Renda per capita'),
+    ]
+
     graficos = {}
-    anos = df['Ano']
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        futuros = []
+        for descricao, caminho, series, titulo, rotulo_y in tarefas:
+            futuros.append(executor.submit(_gerar_grafico, caminho, anos, series, titulo, rotulo_y))
+            graficos[descricao] = caminho
+        for futuro in futuros:
+            futuro.result()
     
-    # Gráfico 1: Evolução dos Indicadores
-    plt.figure(figsize=(10, 6))
-    plt.plot(anos, df['População Estimada'], marker='o', label='População')
-    plt.plot(anos, df['PIB Estimado (R$ em Bilhões)'], marker='o', label='PIB')
-    plt.plot(anos, df['Renda per capita (Interpolada)'], marker='o', label='Renda per capita')
-    plt.title('Evolução dos Indicadores (2010-2024)')
-    plt.xlabel('Ano')
-    plt.ylabel('Valores')
-    plt.legend()
-    plt.grid(True)
-    grafico1 = 'grafico_evolucao.png'
-    plt.savefig(grafico1)
-    plt.close()
-    graficos['Evolução dos Indicadores'] = grafico1
-    
-    # Gráfico 2: Dinâmica do PIB (Velocidade e Aceleração)
-    plt.figure(figsize=(10, 6))
-    plt.plot(anos, df['PIB Estimado (R$ em Bilhões) Velocidade'], marker='o', label='Velocidade PIB')
-    plt.plot(anos, df['PIB Estimado (R$ em Bilhões) Aceleração'], marker='o', label='Aceleração PIB')
-    plt.title('Dinâmica do PIB (Velocidade e Aceleração)')
-    plt.xlabel('Ano')
-    plt.ylabel('Variação')
-    plt.legend()
-    plt.grid(True)
-    grafico2 = 'grafico_dinamica_pib.png'
-    plt.savefig(grafico2)
-    plt.close()
-    graficos['Dinâmica do PIB'] = grafico2
-
-    # Gráfico 3: Médias Móveis da Renda per capita
-    plt.figure(figsize=(10, 6))
-    plt.plot(anos, df['Renda per capita (Interpolada)'], marker='o', label='Renda per capita')
-    plt.plot(anos, df['Renda per capita (Interpolada) MM_3'], marker='o', label='Média Móvel 3 anos')
-    plt.plot(anos, df['Renda per capita (Interpolada) MM_7'], marker='o', label='Média Móvel 7 anos')
-    plt.title('Médias Móveis da Renda per capita')
-    plt.xlabel('Ano')
-    plt.ylabel('Renda per capita')
-    plt.legend()
-    plt.grid(True)
-    grafico3 = 'grafico_media_movel.png'
-    plt.savefig(grafico3)
-    plt.close()
-    graficos['Médias Móveis da Renda per capita'] = grafico3
-    
-    # 6) Gerar o relatório DOCX com todas as análises e gráficos
-    gerar_relatorio(df, graficos, arquivo_doc)
+    # 6) Gerar o relatório DOCX com todas as análises e gráficos.
+    # Antes, liberar o que o relatório não usa: das colunas derivadas só a
+    # amostra das 10 primeiras linhas aparece no documento, então o frame
+    # completo (e a entrada do lru_cache que o mantém vivo) é descartado
+    # para que a montagem da árvore XML não dispute memória com ele.
+    colunas_base = ['Ano', 'População Estimada', 'PIB Estimado (R$ em Bilhões)',
+                    'Renda per capita', 'Renda per capita (Interpolada)']
+    df_base = df[colunas_base].copy()
+    amostra_processada = df.head(10).copy()
+    del df
+    montar_dados.cache_clear()
+    gc.collect()
+
+    gerar_relatorio(df_base, amostra_processada, graficos, arquivo_doc)
     
     # 7) (Opcional) Remover arquivos temporários dos gráficos
     for g in graficos.values():
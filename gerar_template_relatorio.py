@@ -0,0 +1,124 @@
+# --------------------------------------------------------------------------------
+# Gera o arquivo 'relatorio_template.docx' usado pelo gerar_relatorio do
+# analise.py. O template contém todo o texto fixo do relatório e tags Jinja
+# (docxtpl) nos pontos dinâmicos: tabelas de dados, estatísticas e gráficos.
+#
+# Rodar `python gerar_template_relatorio.py` sempre que a estrutura do
+# relatório mudar; o .docx gerado é versionado junto com este script.
+# --------------------------------------------------------------------------------
+
+from docx import Document
+
+def main():
+    doc = Document()
+
+    # Título
+    doc.add_heading('Relatório de Análise de Dados do Estado do Maranhão', 0)
+
+    # Introdução
+    doc.add_heading('1. Introdução', level=1)
+    doc.add_paragraph(
+        "Este relatório apresenta uma análise dos dados referentes à População Estimada, PIB Estimado (R$ em Bilhões) e Renda per capita, "
+        "no período de 2010 a 2024. A análise contempla tanto os dados originais quanto os valores processados por meio de fórmulas, "
+        "como interpolação, cálculo de derivadas e médias móveis. Especial atenção foi dada ao impacto da COVID (aproximadamente 2020-2021), "
+        "que provocou variações significativas nos indicadores."
+    )
+
+    # Dados Originais
+    doc.add_heading('2. Dados Originais', level=1)
+    doc.add_paragraph("A seguir, apresenta-se uma amostra dos dados originais conforme extraídos da planilha:")
+
+    tabela_origem = doc.add_table(rows=4, cols=4)
+    hdr_cells = tabela_origem.rows[0].cells
+    for i, col in enumerate(['Ano', 'População Estimada', 'PIB Estimado (R$ em Bilhões)', 'Renda per capita']):
+        hdr_cells[i].text = col
+    tabela_origem.rows[1].cells[0].text = '{%tr for linha in dados_orig %}'
+    for i in range(4):
+        tabela_origem.rows[2].cells[i].text = '{{ linha[%d] }}' % i
+    tabela_origem.rows[3].cells[0].text = '{%tr endfor %}'
+
+    # Processos de Cálculo
+    doc.add_heading('3. Processo de Cálculo e Tratamento dos Dados', level=1)
+    doc.add_paragraph(
+        "Para obter uma análise mais robusta, foram aplicados os seguintes processos:\n"
+        "- **Interpolação Linear**: Preenche os valores faltantes na coluna 'Renda per capita', gerando a coluna "
+        "'Renda per capita (Interpolada)'.\n"
+        "- **Derivadas (Velocidade e Aceleração)**: Calculadas para cada indicador para evidenciar a taxa de variação "
+        "anual e a mudança dessa taxa. Nota: Para 'População Estimada', foi considerado um intervalo de 2 anos.\n"
+        "- **Médias Móveis**: Foram calculadas para janelas de 3 e 7 anos, suavizando oscilações e destacando as tendências de longo prazo.\n"
+        "- **Medidas de Dispersão**: Média, variância e desvio padrão foram computados para quantificar a dispersão dos dados."
+    )
+
+    # Tabela de Estatísticas Descritivas
+    doc.add_heading('4. Estatísticas Descritivas', level=1)
+    doc.add_paragraph("A tabela abaixo resume as principais medidas de dispersão dos indicadores:")
+    tabela_estat = doc.add_table(rows=4, cols=5)
+    hdr_cells = tabela_estat.rows[0].cells
+    for i, rotulo in enumerate(['Métrica', 'População', 'PIB', 'Renda p/ capita', 'Renda (Interp.)']):
+        hdr_cells[i].text = rotulo
+    tabela_estat.rows[1].cells[0].text = '{%tr for linha in estatisticas %}'
+    for i in range(5):
+        tabela_estat.rows[2].cells[i].text = '{{ linha[%d] }}' % i
+    tabela_estat.rows[3].cells[0].text = '{%tr endfor %}'
+
+    # Gráficos e Análises Visuais
+    doc.add_heading('5. Gráficos e Análises Visuais', level=1)
+    doc.add_paragraph(
+        "Os gráficos a seguir apresentam de forma visual a evolução dos indicadores, as derivadas (velocidade e aceleração) e as médias móveis. "
+        "Cada gráfico foi elaborado para facilitar a interpretação das tendências e das oscilações dos dados."
+    )
+    doc.add_paragraph('{%p for grafico in graficos %}')
+    doc.add_paragraph('{{ grafico.titulo }}', style='Heading 2')
+    doc.add_paragraph('{{ grafico.imagem }}')
+    doc.add_paragraph('{{ grafico.descricao }}')
+    doc.add_paragraph('{%p endfor %}')
+
+    # Análise do Período da COVID
+    doc.add_heading('6. Impacto do Período da COVID', level=1)
+    doc.add_paragraph(
+        "O período da COVID (aproximadamente 2020-2021) mostrou impactos significativos nos indicadores analisados. "
+        "Observa-se que:\n"
+        "- O PIB apresentou uma queda acentuada durante os anos de 2020 e 2021, refletindo a desaceleração econômica global.\n"
+        "- A Renda per capita sofreu variações marcantes, possivelmente devido à perda de empregos e à redução do poder de compra.\n"
+        "- A população, coletada em alguns anos de forma bienal, mostra variações que devem ser interpretadas com cautela, "
+        "pois a frequência da coleta pode mascarar mudanças abruptas ocorridas durante a pandemia.\n\n"
+        "Esses efeitos evidenciam a importância de se aplicar técnicas de suavização, como as médias móveis, e de se analisar as derivadas "
+        "(velocidade e aceleração) para compreender melhor a dinâmica dos dados durante períodos de crise."
+    )
+
+    # Dados Gerados pelas Fórmulas (amostra)
+    doc.add_heading('7. Dados Processados e Resultados das Fórmulas', level=1)
+    doc.add_paragraph(
+        "A tabela a seguir apresenta uma amostra dos dados processados, incluindo os cálculos de derivadas e médias móveis. "
+        "Estes dados foram gerados automaticamente a partir dos dados originais e permitem uma análise quantitativa detalhada."
+    )
+    # Tabela com número de colunas dinâmico: laços {%tc %} para as colunas
+    # e {%tr %} para as linhas
+    tabela_proc = doc.add_table(rows=4, cols=3)
+    tabela_proc.rows[0].cells[0].text = '{%tc for col in colunas_proc %}'
+    tabela_proc.rows[0].cells[1].text = '{{ col }}'
+    tabela_proc.rows[0].cells[2].text = '{%tc endfor %}'
+    tabela_proc.rows[1].cells[0].text = '{%tr for linha in dados_proc %}'
+    tabela_proc.rows[2].cells[0].text = '{%tc for valor in linha %}'
+    tabela_proc.rows[2].cells[1].text = '{{ valor }}'
+    tabela_proc.rows[2].cells[2].text = '{%tc endfor %}'
+    tabela_proc.rows[3].cells[0].text = '{%tr endfor %}'
+
+    # Conclusões Finais
+    doc.add_heading('8. Conclusões e Observações Finais', level=1)
+    doc.add_paragraph(
+        "Em síntese, a análise dos dados revela que:\n"
+        "- Os processos de interpolação, cálculo de derivadas e médias móveis foram fundamentais para suavizar as oscilações e "
+        "destacar as tendências dos indicadores ao longo dos anos.\n"
+        "- O período da COVID impactou negativamente o PIB e a Renda per capita, embora haja sinais de recuperação pós-pandemia.\n"
+        "- A coleta de dados populacionais de forma bienal impõe desafios na interpretação de variações abruptas, sendo necessário "
+        "cautela ao analisar esses números.\n\n"
+        "Essas análises permitem um entendimento mais profundo das dinâmicas socioeconômicas do Estado do Maranhão, "
+        "oferecendo subsídios para decisões e políticas públicas fundamentadas."
+    )
+
+    doc.save('relatorio_template.docx')
+    print('[OK] Template "relatorio_template.docx" gerado com sucesso.')
+
+if __name__ == '__main__':
+    main()